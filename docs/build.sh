@@ -0,0 +1,16 @@
+#!/usr/bin/env bash
+# Build the Sphinx documentation with parallel workers and a persistent
+# doctree cache. The cache under docs/_build/doctrees is deliberately kept
+# between runs so incremental builds only re-read changed documents; pass
+# --clean to force a full rebuild.
+set -euo pipefail
+
+DOCS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+BUILD_DIR="${DOCS_DIR}/_build"
+
+if [[ "${1:-}" == "--clean" ]]; then
+    rm -rf "${BUILD_DIR}"
+    shift
+fi
+
+sphinx-build -b html -j auto -d "${BUILD_DIR}/doctrees" "$@" "${DOCS_DIR}" "${BUILD_DIR}/html"
@@ -21,14 +21,10 @@ copyright = f"{datetime.now():%Y}, {author}"
 extensions = [
     "sphinx.ext.autodoc",
     "sphinx.ext.autosummary",
-    "sphinx.ext.coverage",
     "sphinx.ext.doctest",
-    "sphinx.ext.duration",
     "sphinx.ext.githubpages",
-    "sphinx.ext.ifconfig",
     "sphinx.ext.intersphinx",
     "sphinx.ext.napoleon",
-    "sphinx.ext.todo",
     "sphinx.ext.viewcode",
     "sphinxcontrib.mermaid",
     "sphinx_copybutton",
@@ -53,10 +49,6 @@ napoleon_use_param = True
 napoleon_use_rtype = True
 napoleon_attr_annotations = True
 
-# Todo settings
-todo_include_todos = True
-todo_link_only = True
-
 # Mermaid configuration
 mermaid_version = "10.9.1"
 mermaid_output_format = "raw"
@@ -67,15 +59,15 @@ copybutton_prompt_text = r'>>> |\.\.\. |\$ |In \[\d+\]: |\s*\.\.\.: |\s*\$ |\s*#
 copybutton_prompt_is_regexp = True
 copybutton_line_continuation_character = '\\'
 
+# Sphinx fetches the inventories below concurrently (one worker per target)
+# and caches them in the doctree directory; keep the cache for a day so
+# repeated local builds skip the HTTPS round-trips entirely.
+intersphinx_cache_limit = 1
+intersphinx_timeout = 10
+
 intersphinx_mapping = {
-    "python": (
-        "https://docs.python.org/3",
-        "https://docs.python.org/3/objects.inv",
-    ),
-    "pydantic": (
-        "https://docs.pydantic.dev/latest/",
-        "https://docs.pydantic.dev/latest/objects.inv",
-    ),
+    "python": ("https://docs.python.org/3", None),
+    "pydantic": ("https://docs.pydantic.dev/latest/", None),
 }
 
 templates_path = ["_templates"]
@@ -93,8 +85,6 @@ html_theme_options = {
     "show_navbar_depth": 2,
 }
 
-
-
 pygments_style = "monokai"
 
 rst_prolog = """
@@ -109,6 +109,54 @@ export const WebSocketProvider = ({ children }) => {
     [addMessage, updateMessageById],
   );
 
+  const handleTokenMessage = useCallback(
+    (message) => {
+      const content = message.content || '';
+      if (!content) {
+        return;
+      }
+
+      // Streamed tokens are raw answer fragments; append them verbatim —
+      // the paragraph separator used for 'chunk' frames would mangle them.
+      if (!currentResponseIdRef.current) {
+        const responseId = `bot-${Date.now()}`;
+        currentResponseIdRef.current = responseId;
+        addMessage({
+          id: responseId,
+          sender: 'bot',
+          text: content,
+          sources: [],
+          timestamp: new Date().toISOString(),
+        });
+        return;
+      }
+
+      const responseId = currentResponseIdRef.current;
+      let found = false;
+      updateMessageById(responseId, (existing) => {
+        if (!existing) {
+          return existing;
+        }
+        found = true;
+        return {
+          ...existing,
+          text: `${existing.text || ''}${content}`,
+        };
+      });
+
+      if (!found) {
+        addMessage({
+          id: responseId,
+          sender: 'bot',
+          text: content,
+          sources: [],
+          timestamp: new Date().toISOString(),
+        });
+      }
+    },
+    [addMessage, updateMessageById],
+  );
+
   const handleCompleteMessage = useCallback(
     (message) => {
       const finalContent = message.content || '';
@@ -224,6 +272,11 @@ export const WebSocketProvider = ({ children }) => {
         return;
       }
 
+      if (payload.type === 'token') {
+        handleTokenMessage(payload);
+        return;
+      }
+
       if (payload.type === 'chunk') {
         handleChunkMessage(payload);
         return;
@@ -297,6 +350,7 @@ export const WebSocketProvider = ({ children }) => {
     flushPendingMessages,
     handleChunkMessage,
     handleCompleteMessage,
+    handleTokenMessage,
     maxReconnectDelay,
     stopAllJobPollers,
     websocketUrl,
@@ -1,14 +1,36 @@
 """
 Main entry point for the RAG LLM application.
 This file is used to run the FastAPI application in production.
+
+Configuration is driven by environment variables so the same entry point
+serves both workflows:
+
+- RELOAD=true enables the dev file-watcher (forces a single worker).
+- WEB_CONCURRENCY controls the number of worker processes (default 4).
+
+Production runs use uvloop and httptools when installed; uvicorn's "auto"
+setting falls back to the stdlib loop and h11 parser otherwise.
 """
+import os
+
 import uvicorn
 
 if __name__ == "__main__":
+    reload_enabled = os.getenv("RELOAD", "false").lower() in ("1", "true", "yes")
     uvicorn.run(
         "src.api:app",
         host="0.0.0.0",
-        port=8000,
-        reload=True,
-        workers=1  # For development; remove or increase for production
+        port=int(os.getenv("PORT", "8000")),
+        reload=reload_enabled,
+        workers=1 if reload_enabled else int(os.getenv("WEB_CONCURRENCY", "4")),
+        loop="auto",
+        http="auto",
+        # Each RAG query can hold a slot for seconds; cap in-flight
+        # connections so bursts shed load with fast 503s instead of
+        # collapsing tail latency.
+        limit_concurrency=int(os.getenv("UVICORN_LIMIT_CONCURRENCY", "64")),
+        backlog=2048,
+        # Streamed token frames are tiny; permessage-deflate costs more in
+        # per-frame CPU than it saves in bandwidth at that size.
+        ws_per_message_deflate=False,
     )
@@ -23,21 +23,26 @@ Environment Variables:
 - DEBUG: Enable debug mode
 """
 import os
-import json
 import asyncio
 import time
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 
 from datetime import datetime
 import contextlib
 from contextlib import asynccontextmanager
 from urllib.parse import quote
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, UploadFile, File, status, Request
+import anyio.to_thread
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, UploadFile, File, Response, status, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
+from fastapi.websockets import WebSocketState
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from starlette.exceptions import HTTPException as StarletteHTTPException
+import orjson
 import uvicorn
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from src.llm import get_llm, run_llm_health_check
 from src.logging_config import get_logger
 from src.exceptions import (
@@ -56,6 +61,38 @@ from src.middleware.observability import setup_observability
 # Initialize logger
 logger = get_logger(__name__)
 
+
+def _json_dumps(payload: Any) -> str:
+    """Serialize WebSocket payloads with orjson (much faster than stdlib json)."""
+    return orjson.dumps(payload).decode("utf-8")
+
+
+def _json_loads(data: str) -> Any:
+    """Deserialize inbound WebSocket messages with orjson."""
+    return orjson.loads(data)
+
+
+# Control frames that never vary are encoded once at import so the
+# keep-alive and status paths reduce to a plain socket write.
+_FRAME_PING = _json_dumps({"type": "ping"})
+_FRAME_PONG = _json_dumps({"type": "pong"})
+_FRAME_CONNECTED = _json_dumps({"type": "status", "status": "connected"})
+_FRAME_PROCESSING = _json_dumps({"type": "status", "status": "processing"})
+_FRAME_STOPPED = _json_dumps({"type": "status", "status": "stopped"})
+_FRAME_IDLE = _json_dumps({"type": "status", "status": "idle"})
+_FRAME_TIMEOUT_ERROR = _json_dumps(
+    {"type": "error", "message": "Connection timeout. Closing connection."}
+)
+_FRAME_INVALID_JSON = _json_dumps({"type": "error", "message": "Invalid JSON format"})
+_FRAME_EMPTY_QUESTION = _json_dumps({"type": "error", "message": "Question cannot be empty"})
+_FRAME_UNSUPPORTED_TYPE = _json_dumps({"type": "error", "message": "Unsupported message type"})
+
+# Streamed tokens are batched until either threshold is hit; see
+# _process_websocket_query.
+_TOKEN_FLUSH_INTERVAL = 0.025
+_TOKEN_FLUSH_CHARS = 32
+
+
 ingestion_service = IngestionService()
 rag_service = RAGService()
 app_service = RAGApplicationService(ingestion_service, rag_service)
@@ -63,6 +100,12 @@ app_service = RAGApplicationService(ingestion_service, rag_service)
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):  # pragma: no cover - framework integration
+    # anyio's default thread limiter (40 tokens) is the real concurrency
+    # ceiling for blocking RAG work pushed onto worker threads; raise it so
+    # chain queries and file I/O can interleave under bursty load.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = int(
+        os.getenv("RAG_THREADPOOL_SIZE", "100")
+    )
     await init_database()
     warmup_task: Optional[asyncio.Task] = None
     try:
@@ -82,27 +125,43 @@ async def lifespan(_app: FastAPI):  # pragma: no cover - framework integration
                 await warmup_task
 
 
+# Inventory cache keyed on the raw-data directory's mtime. Uploads always
+# create or remove directory entries, which bumps the directory mtime, so a
+# matching mtime means the cached listing is still accurate and polling
+# clients cost a single stat instead of a stat per file.
+_files_inventory_cache: Dict[str, Any] = {"mtime_ns": None, "inventory": []}
+
+
 def _get_files_inventory() -> List[Dict[str, Any]]:
     from src.config import RAW_DATA_DIR
 
     inventory: List[Dict[str, Any]] = []
-    if not os.path.exists(RAW_DATA_DIR):
+    try:
+        dir_mtime_ns = os.stat(RAW_DATA_DIR).st_mtime_ns
+    except FileNotFoundError:
         return inventory
 
-    for entry in os.listdir(RAW_DATA_DIR):
-        absolute_path = os.path.join(RAW_DATA_DIR, entry)
-        if not os.path.isfile(absolute_path):
-            continue
+    if dir_mtime_ns == _files_inventory_cache["mtime_ns"]:
+        return _files_inventory_cache["inventory"]
+
+    # scandir yields cached type/stat info with the directory read itself,
+    # avoiding the extra isfile/stat syscall pair per entry.
+    with os.scandir(RAW_DATA_DIR) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
 
-        stats = os.stat(absolute_path)
-        inventory.append({
-            "name": entry,
-            "size": stats.st_size,
-            "uploadDate": datetime.fromtimestamp(stats.st_mtime).isoformat(),
-            "previewUrl": f"/files/preview/{quote(entry)}",
-        })
+            stats = entry.stat()
+            inventory.append({
+                "name": entry.name,
+                "size": stats.st_size,
+                "uploadDate": datetime.fromtimestamp(stats.st_mtime).isoformat(),
+                "previewUrl": f"/files/preview/{quote(entry.name)}",
+            })
 
     inventory.sort(key=lambda item: item["uploadDate"], reverse=True)
+    _files_inventory_cache["mtime_ns"] = dir_mtime_ns
+    _files_inventory_cache["inventory"] = inventory
     return inventory
 
 # Initialize FastAPI app
@@ -111,6 +170,9 @@ app = FastAPI(
     description="API for document ingestion and question answering using RAG",
     version="0.2.0",
     lifespan=lifespan,
+    # orjson-encode every response by default; conversation and file
+    # listings return plain dicts/lists that skip jsonable_encoder work.
+    default_response_class=ORJSONResponse,
 )
 
 setup_observability(app)
@@ -125,96 +187,74 @@ app.add_middleware(
 )
 
 # Exception Handlers
-@app.exception_handler(DocumentProcessingError)
-async def document_processing_exception_handler(_request: Request, exc: DocumentProcessingError):
-    logger.error("Document processing error", error=str(exc), details=exc.details)
-    return JSONResponse(
-        status_code=422,
-        content={
-            "error": "Document Processing Error",
-            "message": exc.message,
-            "details": exc.details
-        }
-    )
+# One handler body serves every RAGException subclass; the table maps each
+# type to its status code, response title, log message, and log level.
+# Starlette resolves handlers by walking the exception's MRO, so the most
+# specific registered type wins regardless of registration order.
+_EXCEPTION_HANDLERS = [
+    (DocumentProcessingError, 422, "Document Processing Error", "Document processing error", "error"),
+    (VectorStoreError, 500, "Vector Store Error", "Vector store error", "error"),
+    (LLMError, 503, "LLM Service Error", "LLM error", "error"),
+    (ValidationError, 400, "Validation Error", "Validation error", "warning"),
+    (ConversationError, 500, "Conversation Error", "Conversation error", "error"),
+    (RAGException, 500, "RAG Pipeline Error", "RAG pipeline error", "error"),
+]
+
+
+def _register_exception_handlers() -> None:
+    for exc_type, status_code, title, log_message, log_level in _EXCEPTION_HANDLERS:
+        async def handler(_request: Request, exc: RAGException,
+                          status_code=status_code, title=title,
+                          log_message=log_message, log_level=log_level):
+            getattr(logger, log_level)(log_message, error=str(exc), details=exc.details)
+            # orjson serializes the error envelope in C; these handlers can
+            # run on every request of an error-heavy workload.
+            return ORJSONResponse(
+                status_code=status_code,
+                content={
+                    "error": title,
+                    "message": exc.message,
+                    "details": exc.details,
+                },
+            )
 
-@app.exception_handler(VectorStoreError)
-async def vector_store_exception_handler(_request: Request, exc: VectorStoreError):
-    logger.error("Vector store error", error=str(exc), details=exc.details)
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "Vector Store Error",
-            "message": exc.message,
-            "details": exc.details
-        }
-    )
+        app.add_exception_handler(exc_type, handler)
 
-@app.exception_handler(LLMError)
-async def llm_exception_handler(_request: Request, exc: LLMError):
-    logger.error("LLM error", error=str(exc), details=exc.details)
-    return JSONResponse(
-        status_code=503,
-        content={
-            "error": "LLM Service Error",
-            "message": exc.message,
-            "details": exc.details
-        }
-    )
 
-@app.exception_handler(ValidationError)
-async def validation_exception_handler(_request: Request, exc: ValidationError):
-    logger.warning("Validation error", error=str(exc), details=exc.details)
-    return JSONResponse(
-        status_code=400,
-        content={
-            "error": "Validation Error",
-            "message": exc.message,
-            "details": exc.details
-        }
-    )
+_register_exception_handlers()
+
 
-@app.exception_handler(ConversationError)
-async def conversation_exception_handler(_request: Request, exc: ConversationError):
-    logger.error("Conversation error", error=str(exc), details=exc.details)
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "Conversation Error",
-            "message": exc.message,
-            "details": exc.details
-        }
+# FastAPI's stock HTTPException and validation handlers serialize through
+# stdlib json; route them through orjson like every other response.
+@app.exception_handler(StarletteHTTPException)
+async def _http_exception_handler(_request: Request, exc: StarletteHTTPException):
+    return ORJSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.detail},
+        headers=getattr(exc, "headers", None),
     )
 
-@app.exception_handler(RAGException)
-async def rag_exception_handler(_request: Request, exc: RAGException):
-    logger.error("RAG pipeline error", error=str(exc), details=exc.details)
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "RAG Pipeline Error",
-            "message": exc.message,
-            "details": exc.details
-        }
+
+@app.exception_handler(RequestValidationError)
+async def _validation_exception_handler(_request: Request, exc: RequestValidationError):
+    # jsonable_encoder strips the exception objects pydantic tucks into ctx.
+    return ORJSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": jsonable_encoder(exc.errors())},
     )
 
 # Request/Response Models
 class QueryRequest(BaseModel):
+    # Stripping happens in pydantic-core before the Field length bounds run,
+    # so the old Python-level strip/length validators were duplicate work.
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     question: str = Field(..., min_length=1, max_length=2000, description="User question")
     chat_history: Optional[List[Dict[str, str]]] = Field(
         default_factory=list,
         description="List of previous messages in the conversation"
     )
     conversation_id: Optional[int] = Field(None, description="Conversation ID for persistence")
-    
-    @field_validator('question')
-    @classmethod
-    def validate_question(cls, v: str) -> str:
-        if not v or not v.strip():
-            raise ValueError('Question cannot be empty')
-        normalized = v.strip()
-        if len(normalized) > 2000:
-            raise ValueError('Question too long (max 2000 characters)')
-        return normalized
 
     @field_validator('chat_history')
     @classmethod
@@ -224,18 +264,10 @@ class QueryRequest(BaseModel):
         return v
 
 class ConversationCreateRequest(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     title: str = Field(..., min_length=1, max_length=200, description="Conversation title")
     user_id: str = Field(default="default_user", description="User ID for the conversation")
-    
-    @field_validator('title')
-    @classmethod
-    def validate_title(cls, v: str) -> str:
-        if not v or not v.strip():
-            raise ValueError('Title cannot be empty')
-        normalized = v.strip()
-        if len(normalized) > 200:
-            raise ValueError('Title too long (max 200 characters)')
-        return normalized
 
 class QueryResponse(BaseModel):
     answer: str
@@ -299,34 +331,89 @@ class ConnectionManager:
     - Handling concurrent tasks per connection
     
     Attributes:
-        active_connections: List of currently active WebSocket connections.
+        active_connections: Set of currently active WebSocket connections.
         _active_tasks: Dictionary mapping WebSockets to their active tasks.
     """
+
+    _OUT_QUEUE_MAXSIZE = 256
+
     def __init__(self):
-        """Initialize the connection manager with empty connection and task lists."""
-        self.active_connections: List[WebSocket] = []
+        """Initialize the connection manager with empty connection and task sets."""
+        self.active_connections: Set[WebSocket] = set()
         self._active_tasks: Dict[WebSocket, asyncio.Task] = {}
+        self._out_queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._writer_tasks: Dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
+        # One bounded outbound queue and one writer task per socket:
+        # producers enqueue without awaiting buffer drain, and the queue
+        # bound turns a slow consumer into backpressure instead of memory.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._OUT_QUEUE_MAXSIZE)
+        self._out_queues[websocket] = queue
+        self._writer_tasks[websocket] = asyncio.create_task(
+            self._drain_outbound(websocket, queue)
+        )
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        # discard() is O(1) and tolerates double-disconnects from the
+        # broadcast error path racing the handler's own cleanup.
+        self.active_connections.discard(websocket)
         task = self._active_tasks.pop(websocket, None)
         if task and not task.done():
             task.cancel()
+        queue = self._out_queues.pop(websocket, None)
+        writer = self._writer_tasks.pop(websocket, None)
+        if writer and not writer.done():
+            # Let the writer drain frames enqueued just before teardown
+            # (timeout errors, the stopped status) instead of cancelling
+            # them away; the sentinel makes it exit once the queue empties.
+            if queue is not None:
+                try:
+                    queue.put_nowait(None)
+                except asyncio.QueueFull:
+                    writer.cancel()
+            else:
+                writer.cancel()
 
     @staticmethod
-    async def send_personal_message(message: str, websocket: WebSocket):
-        await websocket.send_text(message)
+    async def _drain_outbound(websocket: WebSocket, queue: asyncio.Queue):
+        """Single writer loop for one socket; ends on cancel or send failure."""
+        try:
+            while True:
+                message = await queue.get()
+                if message is None:
+                    # Teardown sentinel from disconnect(): everything queued
+                    # ahead of it has been flushed, so exit cleanly.
+                    break
+                await websocket.send_text(message)
+        except asyncio.CancelledError:
+            pass
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.debug("Outbound writer stopped", error=str(exc))
+
+    async def send_personal_message(self, message: str, websocket: WebSocket):
+        queue = self._out_queues.get(websocket)
+        if queue is None:
+            await websocket.send_text(message)
+            return
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Slow consumer: await the put so backpressure reaches the
+            # producer rather than the queue growing without bound.
+            await queue.put(message)
 
     async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting message: {e}")
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(message) for connection in connections),
+            return_exceptions=True,
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, BaseException):
+                logger.error("Error broadcasting message", error=str(result))
                 self.disconnect(connection)
 
     def set_task(self, websocket: WebSocket, task: asyncio.Task) -> None:
@@ -379,7 +466,7 @@ async def health_check() -> HealthResponse:
         )
 
 
-@app.post("/ingest", response_model=IngestResponse)
+@app.post("/ingest", response_model=IngestResponse, status_code=status.HTTP_202_ACCEPTED)
 async def ingest_document(file: UploadFile = File(...)):
     """
     Uploads and processes a document for ingestion into the RAG pipeline.
@@ -475,6 +562,25 @@ async def list_uploaded_files():
         raise HTTPException(status_code=500, detail="Unable to list uploaded files")
 
 
+async def _send_error_frame(websocket: WebSocket, frame: str) -> None:
+    """Best-effort error delivery to a possibly-broken socket.
+
+    Skips sockets that already disconnected and bounds the send so a stuck
+    peer cannot park the handler in teardown.
+    """
+    if websocket.client_state != WebSocketState.CONNECTED:
+        return
+    try:
+        await asyncio.wait_for(
+            manager.send_personal_message(frame, websocket), timeout=0.5
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.debug(
+            "Failed to deliver error frame",
+            websocket_client=str(getattr(websocket, "client", "unknown")),
+        )
+
+
 async def _process_websocket_query(
     websocket: WebSocket,
     question: str,
@@ -483,48 +589,84 @@ async def _process_websocket_query(
 ) -> None:
     """Process a single WebSocket query message and stream the answer."""
     await manager.send_personal_message(
-        json.dumps({"type": "status", "status": "processing"}),
+        _FRAME_PROCESSING,
         websocket,
     )
 
+    # Coalesce streamed tokens before sending: one frame per token pays a
+    # JSON encode plus WebSocket framing per word, while a ~25ms/32-char
+    # batch is imperceptible at reading speed and cuts frame count ~10x.
+    loop = asyncio.get_running_loop()
+    token_buffer: List[str] = []
+    buffered_chars = 0
+    last_flush = loop.time()
+
+    async def _flush_tokens() -> None:
+        nonlocal buffered_chars, last_flush
+        if not token_buffer:
+            return
+        await manager.send_personal_message(
+            _json_dumps({"type": "token", "content": "".join(token_buffer)}),
+            websocket,
+        )
+        token_buffer.clear()
+        buffered_chars = 0
+        last_flush = loop.time()
+
     try:
-        result = await app_service.query(
+        # Stream tokens as the LLM produces them so the client sees the
+        # answer grow instead of waiting for the full generation.
+        async for frame in app_service.stream_query(
             question=question,
             chat_history=chat_history,
             conversation_id=conversation_id,
-        )
+        ):
+            if frame.get("type") == "token":
+                token_buffer.append(frame["content"])
+                buffered_chars += len(frame["content"])
+                if (
+                    buffered_chars >= _TOKEN_FLUSH_CHARS
+                    or loop.time() - last_flush >= _TOKEN_FLUSH_INTERVAL
+                ):
+                    await _flush_tokens()
+                continue
 
-        await manager.send_personal_message(
-            json.dumps(
-                {
-                    "type": "complete",
-                    "content": result["answer"],
-                    "sources": result.get("sources", []),
-                    "confidence_score": result.get("confidence_score"),
-                    "template_used": result.get("template_used"),
-                    "num_sources": result.get("num_sources"),
-                }
-            ),
-            websocket,
-        )
+            await _flush_tokens()
+            await manager.send_personal_message(
+                _json_dumps(
+                    {
+                        "type": "complete",
+                        "content": frame["answer"],
+                        "sources": frame.get("sources", []),
+                        "confidence_score": frame.get("confidence_score"),
+                        "template_used": frame.get("template_used"),
+                        "num_sources": frame.get("num_sources"),
+                    }
+                ),
+                websocket,
+            )
 
     except RuntimeError as exc:
-        await manager.send_personal_message(
-            json.dumps({"type": "error", "message": str(exc)}),
-            websocket,
+        await _send_error_frame(
+            websocket, _json_dumps({"type": "error", "message": str(exc)})
         )
     except asyncio.CancelledError:
         logger.info("Generation cancelled for WebSocket client", websocket_client=str(getattr(websocket, "client", "unknown")))
+        # Drain whatever was buffered so the client keeps the partial answer.
+        await _flush_tokens()
         await manager.send_personal_message(
-            json.dumps({"type": "status", "status": "stopped"}),
+            _FRAME_STOPPED,
             websocket,
         )
         raise
     except Exception as exc:
-        logger.error("Error processing WebSocket query", error=str(exc), exc_info=True)
-        await manager.send_personal_message(
-            json.dumps({"type": "error", "message": f"Error processing your request: {exc}"}),
+        # Full tracebacks are expensive to format on a hot failure path;
+        # keep them at debug and record the error itself at error level.
+        logger.error("Error processing WebSocket query", error=str(exc))
+        logger.debug("WebSocket query failure detail", exc_info=True)
+        await _send_error_frame(
             websocket,
+            _json_dumps({"type": "error", "message": f"Error processing your request: {exc}"}),
         )
 
 
@@ -596,7 +738,7 @@ async def websocket_endpoint(websocket: WebSocket):
     logger.info("New WebSocket connection", client=str(getattr(websocket, "client", "unknown")))
 
     await manager.send_personal_message(
-        json.dumps({"type": "status", "status": "connected"}),
+        _FRAME_CONNECTED,
         websocket,
     )
 
@@ -606,27 +748,34 @@ async def websocket_endpoint(websocket: WebSocket):
             while True:
                 await asyncio.sleep(30)  # Ping every 30 seconds
                 await manager.send_personal_message(
-                    json.dumps({"type": "ping"}),
+                    _FRAME_PING,
                     websocket,
                 )
         except (asyncio.CancelledError, WebSocketDisconnect):
             pass  # Task was cancelled, which is expected on disconnect
         except Exception as e:
-            logger.warning(f"Error in ping task: {e}, closing connection")
+            logger.warning("Error in ping task, closing connection", error=str(e))
             # The main loop will catch the WebSocketDisconnect and clean up.
             with contextlib.suppress(Exception):
                 await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
 
     ping_task = asyncio.create_task(send_periodic_ping())
 
+    # Bind the receive-loop's hot names to locals once: the ping/pong fast
+    # paths run thousands of iterations per connection, and a local lookup
+    # skips the global/attribute resolution on each of them.
+    receive_text = websocket.receive_text
+    send_message = manager.send_personal_message
+    loads = _json_loads
+
     try:
         while True:
             try:
-                data = await asyncio.wait_for(websocket.receive_text(), timeout=60.0)
+                data = await asyncio.wait_for(receive_text(), timeout=60.0)
             except asyncio.TimeoutError:
                 logger.warning("WebSocket timeout", client=str(getattr(websocket, "client", "unknown")))
-                await manager.send_personal_message(
-                    json.dumps({"type": "error", "message": "Connection timeout. Closing connection."}),
+                await send_message(
+                    _FRAME_TIMEOUT_ERROR,
                     websocket,
                 )
                 break
@@ -635,11 +784,11 @@ async def websocket_endpoint(websocket: WebSocket):
                 break
 
             try:
-                message = json.loads(data)
-            except json.JSONDecodeError:
+                message = loads(data)
+            except orjson.JSONDecodeError:
                 logger.warning("Invalid JSON received", payload=data)
-                await manager.send_personal_message(
-                    json.dumps({"type": "error", "message": "Invalid JSON format"}),
+                await send_message(
+                    _FRAME_INVALID_JSON,
                     websocket,
                 )
                 continue
@@ -647,7 +796,7 @@ async def websocket_endpoint(websocket: WebSocket):
             msg_type = message.get("type")
 
             if msg_type == "ping":
-                await manager.send_personal_message(json.dumps({"type": "pong"}), websocket)
+                await send_message(_FRAME_PONG, websocket)
                 continue
 
             if msg_type == "pong":
@@ -656,13 +805,16 @@ async def websocket_endpoint(websocket: WebSocket):
             if msg_type == "query":
                 question = (message.get("question") or "").strip()
                 if not question:
-                    await manager.send_personal_message(
-                        json.dumps({"type": "error", "message": "Question cannot be empty"}),
+                    await send_message(
+                        _FRAME_EMPTY_QUESTION,
                         websocket,
                     )
                     continue
 
-                chat_history = message.get("chat_history", [])
+                # Cap history like QueryRequest.validate_chat_history does;
+                # WebSocket input skips Pydantic validation, so an unbounded
+                # client payload would otherwise flow straight into prompts.
+                chat_history = (message.get("chat_history") or [])[-50:]
                 conversation_id = None
                 raw_conversation_id = message.get("conversation_id")
                 if raw_conversation_id is not None:
@@ -709,14 +861,14 @@ async def websocket_endpoint(websocket: WebSocket):
                     finally:
                         manager.clear_task(websocket)
                 else:
-                    await manager.send_personal_message(
-                        json.dumps({"type": "status", "status": "idle"}),
+                    await send_message(
+                        _FRAME_IDLE,
                         websocket,
                     )
                 continue
 
-            await manager.send_personal_message(
-                json.dumps({"type": "error", "message": "Unsupported message type"}),
+            await send_message(
+                _FRAME_UNSUPPORTED_TYPE,
                 websocket,
             )
 
@@ -738,23 +890,47 @@ async def websocket_endpoint(websocket: WebSocket):
 
 
 # File management endpoints
+# Resolved once at import: path resolution costs getcwd/normpath work per
+# call, and the raw-data directory never moves while the process is running.
+# realpath (not abspath) so the constant matches the realpath'd request
+# target even when the project sits behind a symlink.
+_PREVIEW_DATA_DIR = os.path.realpath(
+    os.path.join(os.path.dirname(__file__), '..', 'data', 'raw')
+)
+
+
 @app.get("/files/preview/{filename}")
-def preview_file(filename: str):
-    """Serve a file for preview (PDF, etc)."""
-    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw')
-    
+async def preview_file(filename: str, request: Request):
+    """Serve a file for preview (PDF, etc).
+
+    Async so the handler does not occupy a threadpool worker; the path
+    checks are a handful of cheap stats, and FileResponse already moves
+    the actual file I/O off the event loop itself.
+    """
     # Sanitize filename to prevent directory traversal
     safe_filename = os.path.basename(filename)
-    fpath = os.path.join(data_dir, safe_filename)
-    
-    # Ensure the resolved path is within the intended directory
-    if not os.path.abspath(fpath).startswith(os.path.abspath(data_dir)):
+    fpath = os.path.join(_PREVIEW_DATA_DIR, safe_filename)
+
+    # Ensure the resolved path is within the intended directory; realpath
+    # also catches symlink escapes that a plain prefix check would miss.
+    if os.path.commonpath([os.path.realpath(fpath), _PREVIEW_DATA_DIR]) != _PREVIEW_DATA_DIR:
         raise HTTPException(status_code=403, detail="Forbidden")
 
     if not os.path.isfile(fpath):
         raise HTTPException(status_code=404, detail="File not found")
-        
-    return FileResponse(fpath)
+
+    # Previews are re-opened constantly while browsing the file list; a
+    # validator derived from mtime and size lets repeat loads short-circuit
+    # to 304 instead of re-sending megabytes of PDF.
+    stats = os.stat(fpath)
+    etag = f'"{stats.st_mtime_ns:x}-{stats.st_size:x}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return FileResponse(
+        fpath,
+        headers={"ETag": etag, "Cache-Control": "private, max-age=60"},
+    )
 
 # Conversation Management Endpoints
 @app.get("/conversations", response_model=ConversationListResponse)
@@ -845,4 +1021,6 @@ async def delete_conversation(conversation_id: int):
 
 
 if __name__ == "__main__":
-    uvicorn.run("api:app", host="0.0.0.0", port=8000, reload=True)
+    # Dev convenience only; production runs go through main.py, which
+    # honours WEB_CONCURRENCY and disables the reloader.
+    uvicorn.run("src.api:app", host="0.0.0.0", port=8000, reload=True)
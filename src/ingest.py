@@ -178,20 +178,24 @@ def _enrich_chunk_metadata(chunks, file_path):
     return chunks
 
 def _calculate_checksum(file_path):
-    """Calculates the SHA-256 checksum of a file."""
+    """Calculates the SHA-256 checksum of a file in bounded chunks."""
     hasher = hashlib.sha256()
     with open(file_path, 'rb') as f:
-        buf = f.read()
-        hasher.update(buf)
+        while buf := f.read(1024 * 1024):
+            hasher.update(buf)
     return hasher.hexdigest()
 
-def process_document(file_path):
+def process_document(file_path, checksum=None):
     """
     Processes a single document:
     1. Checks if the document has been modified using checksums.
     2. If modified or new, loads and splits the document into chunks.
     3. Saves the chunks and the new checksum.
     Returns the chunks if the file was processed, otherwise None.
+
+    If the caller already knows the file's SHA-256 (the upload path hashes
+    the stream while saving it), pass it as ``checksum`` to skip re-reading
+    the file from disk.
     """
     if not os.path.exists(file_path):
         logger.error("File not found", file_path=file_path)
@@ -206,7 +210,7 @@ def process_document(file_path):
     checksum_save_path = os.path.join(CHECKSUM_DIR, f"{base_name}.sha256")
 
     # Check if file has changed
-    current_checksum = _calculate_checksum(file_path)
+    current_checksum = checksum or _calculate_checksum(file_path)
     stored_checksum = None
     if os.path.exists(checksum_save_path):
         try:
@@ -254,7 +258,7 @@ def process_document(file_path):
     # Save chunks and new checksum
     try:
         with open(chunk_save_path, "wb") as f:
-            pickle.dump(chunks, f)
+            pickle.dump(chunks, f, protocol=pickle.HIGHEST_PROTOCOL)
         with open(checksum_save_path, 'w') as f:
             f.write(current_checksum)
         logger.info(f"Successfully processed and saved {len(chunks)} chunks for '{os.path.basename(file_path)}'.")
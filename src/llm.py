@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 import time
@@ -105,6 +106,12 @@ class LLMProviderRegistry:
 
 registry = LLMProviderRegistry()
 
+# Fast path for the overwhelmingly common "no overrides" call: the default
+# client is resolved once and reused without rebuilding the options dict or
+# taking the registry lock on every request.
+_default_llm: Optional[Any] = None
+_default_llm_lock = Lock()
+
 
 def _create_groq_llm(options: Dict[str, Any]) -> ChatGroq:
     api_key = options.get("api_key") or GROQ_API_KEY
@@ -183,6 +190,14 @@ def get_llm(
 ) -> Any:
     """Return a configured LLM instance using the registry and caching."""
 
+    global _default_llm
+    use_defaults = all(
+        value is None
+        for value in (provider, model, temperature, max_output_tokens, request_timeout, api_key, max_retries)
+    )
+    if use_defaults and _default_llm is not None:
+        return _default_llm
+
     options = {
         "model": model or LLM_MODEL,
         "temperature": temperature if temperature is not None else LLM_TEMPERATURE,
@@ -204,7 +219,14 @@ def get_llm(
         model=options["model"],
         temperature=options["temperature"],
     )
-    return registry.create(selected_provider, options)
+    instance = registry.create(selected_provider, options)
+
+    if use_defaults:
+        with _default_llm_lock:
+            if _default_llm is None:
+                _default_llm = instance
+
+    return instance
 
 
 def run_llm_health_check() -> None:
@@ -338,48 +360,16 @@ class EnhancedRAGChain:
                 k=k,
                 use_context=use_context,
             )
-            
-            retriever = self._select_retriever(retriever_overrides)
-
-            retrieval_start = time.perf_counter()
-            if use_context and self.advanced_retriever:
-                history_strings = self._prepare_history(history)
-                documents = self.advanced_retriever.retrieve_with_context(
-                    question,
-                    history_strings,
-                    k=retriever_overrides.get("k") if retriever_overrides else k,
-                )
-            else:
-                retriever_k_to_use = retriever_overrides.get("k") if retriever_overrides else k
-                if hasattr(retriever, "retrieve"):
-                    documents = retriever.retrieve(question, k=retriever_k_to_use)
-                else:
-                    documents = retriever.invoke(question)
-                    if retriever_k_to_use:
-                        documents = documents[:retriever_k_to_use]
-
-            retrieval_duration = time.perf_counter() - retrieval_start
-            observe_rag_retrieval(
-                duration_seconds=retrieval_duration,
-                document_count=len(documents),
-                mode="context" if use_context and self.advanced_retriever else "hybrid",
-            )
-            logger.info("Retrieved documents", count=len(documents), duration=round(retrieval_duration, 4))
-            
-            # Auto-select template if not specified
-            if template_type is None:
-                template_type = prompt_manager.select_template_by_query_type(
-                    question, len(documents)
-                )
-            
-            # Generate enhanced prompt
-            prompt = get_enhanced_prompt(
-                question=question,
-                documents=documents,
-                template_type=template_type,
-                chat_history=history if use_context else None,
+
+            documents, prompt, template_type = self._retrieve_and_prompt(
+                question,
+                template_type,
+                k,
+                history,
+                use_context,
+                retriever_overrides,
             )
-            
+
             llm = self._resolve_llm(llm_overrides)
 
             generation_start = time.perf_counter()
@@ -431,22 +421,166 @@ class EnhancedRAGChain:
                 {"question": question, "error": str(e)},
             )
     
+    def _retrieve_and_prompt(
+        self,
+        question: str,
+        template_type: Optional[str],
+        k: int,
+        history: List[Dict[str, Any]],
+        use_context: bool,
+        retriever_overrides: Optional[Dict[str, Any]],
+    ) -> Tuple[List[Document], str, str]:
+        """Run retrieval and prompt construction shared by query/stream paths."""
+        retriever = self._select_retriever(retriever_overrides)
+
+        retrieval_start = time.perf_counter()
+        if use_context and self.advanced_retriever:
+            history_strings = self._prepare_history(history)
+            documents = self.advanced_retriever.retrieve_with_context(
+                question,
+                history_strings,
+                k=retriever_overrides.get("k") if retriever_overrides else k,
+            )
+        else:
+            retriever_k_to_use = retriever_overrides.get("k") if retriever_overrides else k
+            if hasattr(retriever, "retrieve"):
+                documents = retriever.retrieve(question, k=retriever_k_to_use)
+            else:
+                documents = retriever.invoke(question)
+                if retriever_k_to_use:
+                    documents = documents[:retriever_k_to_use]
+
+        retrieval_duration = time.perf_counter() - retrieval_start
+        observe_rag_retrieval(
+            duration_seconds=retrieval_duration,
+            document_count=len(documents),
+            mode="context" if use_context and self.advanced_retriever else "hybrid",
+        )
+        logger.info("Retrieved documents", count=len(documents), duration=round(retrieval_duration, 4))
+
+        # Auto-select template if not specified
+        if template_type is None:
+            template_type = prompt_manager.select_template_by_query_type(
+                question, len(documents)
+            )
+
+        # Generate enhanced prompt
+        prompt = get_enhanced_prompt(
+            question=question,
+            documents=documents,
+            template_type=template_type,
+            chat_history=history if use_context else None,
+        )
+
+        return documents, prompt, template_type
+
+    async def astream_query(
+        self,
+        question: str,
+        template_type: Optional[str] = None,
+        k: int = 5,
+        include_sources: bool = True,
+        chat_history: Optional[List[Dict[str, Any]]] = None,
+        conversation_context: bool = True,
+    ):
+        """Stream an answer token by token, ending with the full result payload.
+
+        Yields ``{"type": "token", "content": str}`` frames as the LLM
+        produces them, followed by a single ``{"type": "result", ...}`` frame
+        shaped like the return value of :meth:`query`. Retrieval and prompt
+        construction run in a worker thread; generation uses the LLM's native
+        async streaming so the first token reaches the caller before the
+        answer is complete.
+        """
+        direct_result = self._handle_direct_query(question)
+        if direct_result:
+            yield {"type": "token", "content": direct_result["answer"]}
+            yield {"type": "result", **direct_result}
+            return
+
+        try:
+            history = chat_history or []
+            use_context = bool(history) and conversation_context
+
+            logger.info(
+                "Processing streaming RAG query",
+                question=question,
+                k=k,
+                use_context=use_context,
+            )
+
+            documents, prompt, template_type = await asyncio.to_thread(
+                self._retrieve_and_prompt,
+                question,
+                template_type,
+                k,
+                history,
+                use_context,
+                None,
+            )
+
+            llm = self._resolve_llm(None)
+
+            generation_start = time.perf_counter()
+            answer_parts: List[str] = []
+            async for chunk in llm.astream(prompt):
+                text = chunk.content if hasattr(chunk, "content") else str(chunk)
+                if not text:
+                    continue
+                answer_parts.append(text)
+                yield {"type": "token", "content": text}
+            generation_duration = time.perf_counter() - generation_start
+
+            answer = replace_bracket_citations("".join(answer_parts))
+            sources = self._extract_source_info(documents) if include_sources else []
+            confidence_score = self._calculate_confidence_score(answer, documents)
+
+            observe_rag_generation(
+                provider=self.llm_provider,
+                model=self.llm_model,
+                duration_seconds=generation_duration,
+                token_usage={},
+            )
+
+            if conversation_context:
+                self._record_interaction(question, answer, sources if include_sources else [])
+
+            logger.info(
+                "Streaming RAG query completed",
+                template_type=template_type,
+                confidence=confidence_score,
+                num_sources=len(sources),
+            )
+
+            yield {
+                "type": "result",
+                "answer": answer,
+                "sources": sources,
+                "confidence_score": confidence_score,
+                "template_used": template_type,
+                "num_sources": len(documents),
+                "retrieval_stats": self.retriever.get_retrieval_stats() if hasattr(self.retriever, 'get_retrieval_stats') else {},
+            }
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Streaming RAG query failed", question=question, error=str(e))
+            increment_rag_error(component="rag_chain", exception_type=e.__class__.__name__)
+            raise LLMError(
+                f"RAG query failed: {str(e)}",
+                {"question": question, "error": str(e)},
+            )
+
+    _ROLE_PREFIX = {"user": "User: ", "assistant": "Assistant: "}
+
     def _prepare_history(self, chat_history: List[Dict[str, Any]]) -> List[str]:
         """Convert structured chat history into flat strings for the retriever."""
-        history_strings: List[str] = []
-        for message in chat_history[-6:]:  # Limit to last 6 messages (3 exchanges)
-            content = message.get("content")
-            if not content:
-                continue
-            role = message.get("role", "")
-            if role == "user":
-                prefix = "User: "
-            elif role == "assistant":
-                prefix = "Assistant: "
-            else:
-                prefix = ""
-            history_strings.append(f"{prefix}{content}")
-        return history_strings
+        return [
+            f"{self._ROLE_PREFIX.get(message.get('role', ''), '')}{message['content']}"
+            for message in chat_history[-6:]  # Limit to last 6 messages (3 exchanges)
+            if message.get("content")
+        ]
 
     def _extract_source_info(self, documents: List[Document]) -> List[Dict[str, Any]]:
         """Aggregate chunk metadata into normalized source payloads."""
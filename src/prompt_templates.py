@@ -228,8 +228,11 @@ class PromptManager:
                 lines.append(f"Summary: {metadata['snippet']}")
             lines.append("Content:")
             lines.append(doc.page_content)
+            lines.append("\n")
 
-            doc_content = "\n".join(lines) + "\n\n"
+            # Single join produces the block plus its trailing blank line,
+            # avoiding an extra intermediate copy from concatenation.
+            doc_content = "\n".join(lines)
 
             if tokenizer:
                 token_count = len(tokenizer.encode(doc_content))
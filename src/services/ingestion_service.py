@@ -48,6 +48,9 @@ class IngestionService:
         _task_queue: AsyncTaskQueue instance for managing background jobs.
     """
 
+    _UPLOAD_CHUNK_SIZE = 1024 * 1024
+    _INGEST_CONCURRENCY = int(os.getenv("INGEST_CONCURRENCY", "2"))
+
     def __init__(self, task_queue: Optional[AsyncTaskQueue] = None) -> None:
         """Initialize the IngestionService with an optional task queue.
         
@@ -57,6 +60,11 @@ class IngestionService:
         """
         os.makedirs(RAW_DATA_DIR, exist_ok=True)
         self._task_queue = task_queue or AsyncTaskQueue()
+        # Chunking and vector-store rebuilds are CPU- and I/O-heavy; bound
+        # how many run at once so an upload burst queues behind the
+        # semaphore instead of thrashing the shared thread pool that
+        # queries also depend on.
+        self._ingest_semaphore = asyncio.Semaphore(self._INGEST_CONCURRENCY)
 
     def _cleanup_file(self, file_path: str) -> None:
         """Safely remove a file if it exists.
@@ -86,11 +94,11 @@ class IngestionService:
         """Process an uploaded file and enqueue it for background processing.
         
         This method performs the following steps:
-        1. Reads the uploaded file content
-        2. Generates a unique job ID
-        3. Saves the file to persistent storage
-        4. Creates database records for tracking
-        5. Returns the job ID and file path
+        1. Generates a unique job ID
+        2. Streams the uploaded file to persistent storage in bounded chunks,
+           computing its checksum and size along the way
+        3. Creates database records for tracking
+        4. Returns the job ID and file path
         
         Args:
             file: FastAPI UploadFile instance containing the uploaded file.
@@ -104,14 +112,31 @@ class IngestionService:
             IOError: If there's an error saving the file.
             DatabaseError: If there's an error creating the database records.
         """
-        payload = await file.read()
-
         job_id = str(uuid.uuid4())
         original_name = file.filename or "document"
         safe_filename = self._sanitize_filename(original_name)
-        permanent_file_path = self._persist_payload(safe_filename, payload)
+        permanent_file_path = self._reserve_destination(safe_filename)
+
+        # Stream the upload to disk in bounded chunks so large documents never
+        # have to fit in memory; the checksum is computed on the same pass.
+        # Disk writes are pushed to the default thread pool so a slow disk
+        # never stalls the event loop between chunk reads.
+        hasher = hashlib.sha256()
+        file_size = 0
+        try:
+            destination = await asyncio.to_thread(open, permanent_file_path, "wb")
+            try:
+                while chunk := await file.read(self._UPLOAD_CHUNK_SIZE):
+                    hasher.update(chunk)
+                    await asyncio.to_thread(destination.write, chunk)
+                    file_size += len(chunk)
+            finally:
+                await asyncio.to_thread(destination.close)
+        except Exception:
+            self._cleanup_file(permanent_file_path)
+            raise
 
-        checksum = hashlib.sha256(payload).hexdigest()
+        checksum = hasher.hexdigest()
         file_ext = os.path.splitext(safe_filename)[1].lstrip(".").lower() or "unknown"
 
         async with get_session() as session:
@@ -122,7 +147,7 @@ class IngestionService:
                 filename=os.path.basename(permanent_file_path),
                 original_filename=original_name,
                 file_path=permanent_file_path,
-                file_size=len(payload),
+                file_size=file_size,
                 file_type=file_ext,
                 checksum=checksum,
             )
@@ -169,7 +194,8 @@ class IngestionService:
 
         async def _runner() -> None:
             try:
-                result = await self.process_job(job_id, file_path)
+                async with self._ingest_semaphore:
+                    result = await self.process_job(job_id, file_path)
                 if result.get("status") == "completed" and on_success is not None:
                     maybe_awaitable = on_success(result)
                     if asyncio.iscoroutine(maybe_awaitable):
@@ -243,7 +269,11 @@ class IngestionService:
                     details=details,
                 )
 
-            chunks = await asyncio.to_thread(process_document, file_path)
+            # Reuse the checksum computed while streaming the upload so the
+            # worker does not read the file a second time just to hash it.
+            chunks = await asyncio.to_thread(
+                process_document, file_path, checksum=details.get("checksum")
+            )
 
             if not chunks:
                 async with get_session() as session:
@@ -310,23 +340,47 @@ class IngestionService:
             raise
 
     def _persist_payload(self, filename: str, payload: bytes) -> str:
-        file_extension = os.path.splitext(filename)[1]
         safe_filename = self._sanitize_filename(filename)
-        permanent_file_path = os.path.join(RAW_DATA_DIR, safe_filename)
-
-        counter = 1
-        while os.path.exists(permanent_file_path):
-            name_without_ext = os.path.splitext(safe_filename)[0]
-            permanent_file_path = os.path.join(
-                RAW_DATA_DIR, f"{name_without_ext}_{counter}{file_extension}"
-            )
-            counter += 1
+        permanent_file_path = self._reserve_destination(safe_filename)
 
         with open(permanent_file_path, "wb") as destination:
             destination.write(payload)
 
         return permanent_file_path
 
+    @staticmethod
+    def _reserve_destination(safe_filename: str) -> str:
+        """Pick a destination path in RAW_DATA_DIR that does not collide.
+
+        The directory is listed once and candidate names are resolved in
+        memory instead of one os.path.exists stat per counter value. The
+        winning name is claimed immediately with O_CREAT|O_EXCL so two
+        concurrent uploads of the same filename cannot race to one path.
+        """
+        name_without_ext, file_extension = os.path.splitext(safe_filename)
+        try:
+            existing = {entry.name for entry in os.scandir(RAW_DATA_DIR)}
+        except FileNotFoundError:
+            os.makedirs(RAW_DATA_DIR, exist_ok=True)
+            existing = set()
+
+        candidate = safe_filename
+        counter = 1
+        while True:
+            while candidate in existing:
+                candidate = f"{name_without_ext}_{counter}{file_extension}"
+                counter += 1
+
+            permanent_file_path = os.path.join(RAW_DATA_DIR, candidate)
+            try:
+                fd = os.open(permanent_file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                existing.add(candidate)
+                continue
+
+            os.close(fd)
+            return permanent_file_path
+
     @staticmethod
     def _sanitize_filename(filename: str) -> str:
         base_name = os.path.basename(filename.replace("\\", "/")).strip()
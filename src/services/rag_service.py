@@ -17,6 +17,7 @@ import os
 import pickle
 import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from threading import Lock
 from typing import Any, Dict, List, Optional, Callable, Awaitable, Tuple
 
@@ -31,6 +32,7 @@ from src.db.session import get_session
 from src.embed_store import get_retriever, load_vector_store
 from src.llm import EnhancedRAGChain, get_llm
 from src.logging_config import get_logger
+from src.utils.semantic_cache import SemanticQueryCache
 from src.utils.source_formatting import (
     apply_superscript_citations,
     clean_answer_text,
@@ -57,13 +59,18 @@ class RAGService:
         _chain_lock: Thread lock for thread-safe chain initialization.
         _cache_lock: Thread lock for thread-safe cache access.
         _MAX_CHUNK_FILES: Maximum number of chunk files to keep in memory.
+        _MAX_RETRIEVAL_CACHE: Maximum number of cached retrieval results.
     """
 
     _MAX_CHUNK_FILES = 48
+    _MAX_RETRIEVAL_CACHE = 1024
+    _MAX_CONVERSATION_CACHE = 256
+    _MAX_CONVERSATION_LIST_CACHE = 256
+    _CONVERSATION_LIST_TTL = 5.0
 
     def __init__(self) -> None:
         """Initialize a new RAGService instance.
-        
+
         Sets up the service with empty caches and thread locks for thread-safe operations.
         The enhanced RAG chain is initialized lazily when first needed.
         """
@@ -71,16 +78,90 @@ class RAGService:
         self._chunk_cache: OrderedDict[str, List[Any]] = OrderedDict()
         self._chain_lock: Lock = Lock()
         self._cache_lock: Lock = Lock()
+        self._fallback_retriever: Optional[Any] = None
+        self._fallback_prompt: Optional[PromptTemplate] = None
+        self._fallback_chain: Optional[Any] = None
+        self._fallback_lock: Lock = Lock()
+        self._retrieval_cache: OrderedDict[str, List[Any]] = OrderedDict()
+        self._retrieval_cache_lock: asyncio.Lock = asyncio.Lock()
+        self._semantic_cache = SemanticQueryCache(self._embed_question)
+        # Conversation reads back the polling sidebar; a short TTL on the
+        # list and an LRU on single gets keep repeat hits off the database.
+        # The list cache is keyed on client-supplied values, so it carries
+        # an LRU bound too.
+        self._conversation_list_cache: OrderedDict[
+            Tuple[str, int], Tuple[float, List[Dict[str, Any]]]
+        ] = OrderedDict()
+        self._conversation_cache: OrderedDict[int, Dict[str, Any]] = OrderedDict()
+
+    def _invalidate_conversation_caches(self, conversation_id: Optional[int] = None) -> None:
+        """Drop cached conversation reads after a write.
+
+        Any write reorders or reshapes the list, so the list cache is always
+        cleared; single-get entries are dropped per conversation when the id
+        is known, or wholesale otherwise.
+        """
+        self._conversation_list_cache.clear()
+        if conversation_id is None:
+            self._conversation_cache.clear()
+        else:
+            self._conversation_cache.pop(conversation_id, None)
 
     def reset_chain(self) -> None:
         """Reset the RAG chain and clear all cached chunks.
-        
+
         This method is useful for forcing a reload of documents and vector store
         when the underlying data changes.
         """
         self._enhanced_chain = None
         with self._cache_lock:
             self._chunk_cache.clear()
+        with self._fallback_lock:
+            self._fallback_retriever = None
+            self._fallback_chain = None
+        # Cached retrievals and responses are only valid for the current
+        # corpus; dropping them on ingest acts as the retriever version bump.
+        self._retrieval_cache.clear()
+        self._semantic_cache.clear()
+
+    def rebuild_chain(self) -> bool:
+        """Rebuild the enhanced chain off the request path and swap it in.
+
+        Unlike :meth:`reset_chain`, the old chain keeps answering queries
+        until the replacement is fully constructed, so post-ingest traffic
+        never pays the BM25 rebuild latency and concurrent requests cannot
+        stampede into rebuilding it themselves.
+
+        Returns:
+            bool: True if a fresh chain was built and swapped in.
+        """
+        with self._cache_lock:
+            self._chunk_cache.clear()
+        with self._fallback_lock:
+            self._fallback_retriever = None
+            self._fallback_chain = None
+        self._retrieval_cache.clear()
+        self._semantic_cache.clear()
+
+        new_chain: Optional[EnhancedRAGChain] = None
+        try:
+            vectordb = load_vector_store()
+            if vectordb:
+                documents = self._load_documents()
+                if documents:
+                    new_chain = EnhancedRAGChain(vectordb, documents)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Failed to rebuild enhanced RAG chain", error=str(exc))
+
+        with self._chain_lock:
+            self._enhanced_chain = new_chain
+
+        if new_chain is not None:
+            logger.info("Swapped in rebuilt enhanced RAG chain")
+            return True
+
+        logger.warning("Chain rebuild produced no chain; falling back to lazy init")
+        return False
 
     async def create_conversation(self, title: str, user_id: str = "default_user") -> Dict[str, Any]:
         normalized_title = title.strip()
@@ -88,7 +169,9 @@ class RAGService:
             raise ConversationError("Title cannot be empty", details={"title": title})
         async with get_session() as session:
             repo = ConversationRepository(session)
-            return await repo.create(title=normalized_title, messages=[], user_id=user_id)
+            conversation = await repo.create(title=normalized_title, messages=[], user_id=user_id)
+        self._invalidate_conversation_caches()
+        return conversation
 
     async def list_conversations(
         self,
@@ -104,11 +187,31 @@ class RAGService:
         Returns:
             A list of conversation dictionaries, ordered by most recent update.
         """
+        cache_key = (user_id, limit)
+        cached = self._conversation_list_cache.get(cache_key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < self._CONVERSATION_LIST_TTL:
+                self._conversation_list_cache.move_to_end(cache_key)
+                return cached[1]
+            # Expired: drop the entry now rather than letting stale keys
+            # accumulate until eviction pressure reaches them.
+            del self._conversation_list_cache[cache_key]
+
         async with get_session() as session:
             repo = ConversationRepository(session)
-            return await repo.list(user_id=user_id, limit=limit)
+            conversations = await repo.list(user_id=user_id, limit=limit)
+
+        self._conversation_list_cache[cache_key] = (time.monotonic(), conversations)
+        if len(self._conversation_list_cache) > self._MAX_CONVERSATION_LIST_CACHE:
+            self._conversation_list_cache.popitem(last=False)
+        return conversations
 
     async def get_conversation(self, conversation_id: int) -> Dict[str, Any]:
+        cached = self._conversation_cache.get(conversation_id)
+        if cached is not None:
+            self._conversation_cache.move_to_end(conversation_id)
+            return cached
+
         async with get_session() as session:
             repo = ConversationRepository(session)
             conversation = await repo.get(conversation_id)
@@ -117,6 +220,10 @@ class RAGService:
                 f"Conversation {conversation_id} not found",
                 details={"conversation_id": conversation_id},
             )
+
+        self._conversation_cache[conversation_id] = conversation
+        if len(self._conversation_cache) > self._MAX_CONVERSATION_CACHE:
+            self._conversation_cache.popitem(last=False)
         return conversation
 
     async def append_to_conversation(
@@ -152,11 +259,14 @@ class RAGService:
             messages.append(user_message)
             messages.append(assistant_message)
             await repo.update(conversation_id, messages=messages)
+        self._invalidate_conversation_caches(conversation_id)
 
     async def delete_conversation(self, conversation_id: int) -> bool:
         async with get_session() as session:
             repo = ConversationRepository(session)
-            return await repo.delete(conversation_id)
+            deleted = await repo.delete(conversation_id)
+        self._invalidate_conversation_caches(conversation_id)
+        return deleted
 
     def _load_documents(self) -> List[Any]:
         """Load and cache document chunks from the processed data directory.
@@ -173,31 +283,40 @@ class RAGService:
             This method is thread-safe and uses a lock to protect the cache.
         """
         documents: List[Any] = []
-        if not os.path.exists(PROCESSED_DATA_DIR):
+        # scandir yields DirEntry objects whose is_file() comes from the
+        # directory read, so filtering out stray subdirectories costs no
+        # extra stat per entry.
+        try:
+            with os.scandir(PROCESSED_DATA_DIR) as entries:
+                chunk_paths = sorted(
+                    entry.path
+                    for entry in entries
+                    if entry.name.endswith("_chunks.pkl") and entry.is_file()
+                )
+        except FileNotFoundError:
             return documents
 
-        for filename in os.listdir(PROCESSED_DATA_DIR):
-            if not filename.endswith("_chunks.pkl"):
-                continue
-            chunk_path = os.path.join(PROCESSED_DATA_DIR, filename)
-            cached: Optional[List[Any]] = None
-            with self._cache_lock:
+        # Resolve cache hits first so only the misses pay for disk I/O.
+        loaded: Dict[str, List[Any]] = {}
+        misses: List[str] = []
+        with self._cache_lock:
+            for chunk_path in chunk_paths:
                 cached = self._chunk_cache.get(chunk_path)
                 if cached is not None:
                     self._chunk_cache.move_to_end(chunk_path)
-
-            if cached is None:
-                try:
-                    with open(chunk_path, "rb") as handle:
-                        loaded_chunks = pickle.load(handle)
-                except Exception as exc:  # pylint: disable=broad-except
-                    logger.warning(
-                        "Failed to load chunks",
-                        chunk_file=filename,
-                        error=str(exc),
-                    )
+                    loaded[chunk_path] = cached
+                else:
+                    misses.append(chunk_path)
+
+        # Unpickle misses in parallel; each load is dominated by file I/O,
+        # so a small thread pool turns N sequential reads into one round.
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(8, len(misses))) as executor:
+                results = executor.map(self._load_chunk_file, misses)
+
+            for chunk_path, loaded_chunks in zip(misses, results):
+                if loaded_chunks is None:
                     continue
-
                 with self._cache_lock:
                     self._chunk_cache[chunk_path] = loaded_chunks
                     self._chunk_cache.move_to_end(chunk_path)
@@ -207,12 +326,40 @@ class RAGService:
                             "Evicted cached chunk file",
                             chunk_file=os.path.basename(evicted_path),
                         )
-                    cached = loaded_chunks
+                loaded[chunk_path] = loaded_chunks
 
-            documents.extend(cached)
+        for chunk_path in chunk_paths:
+            chunks = loaded.get(chunk_path)
+            if chunks:
+                documents.extend(chunks)
 
         return documents
 
+    @staticmethod
+    def _embed_question(question: str) -> List[float]:
+        """Embed a question with the configured embedding model.
+
+        Imported lazily so the semantic cache degrades to exact matching
+        when the embedding backend is unavailable.
+        """
+        from src.embed_store import get_embedding_model
+
+        return get_embedding_model().embed_query(question)
+
+    @staticmethod
+    def _load_chunk_file(chunk_path: str) -> Optional[List[Any]]:
+        """Load one chunk pickle, returning None on failure."""
+        try:
+            with open(chunk_path, "rb") as handle:
+                return pickle.load(handle)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning(
+                "Failed to load chunks",
+                chunk_file=os.path.basename(chunk_path),
+                error=str(exc),
+            )
+            return None
+
     def _ensure_chain(self) -> Optional[EnhancedRAGChain]:
         """Ensure the RAG chain is initialized and return it.
         
@@ -268,6 +415,20 @@ class RAGService:
         """
         return self._ensure_chain()
 
+    async def _aget_enhanced_chain(self) -> Optional[EnhancedRAGChain]:
+        """Async chain fetch for request paths.
+
+        The already-built chain is returned without leaving the event loop;
+        a cold build (directory walk, pickle loads, BM25 construction) runs
+        in a worker thread so concurrent requests keep being serviced.
+        Startup warmup makes the cold branch rare, but a failed warmup or a
+        reset between requests can still land here.
+        """
+        chain = self._enhanced_chain
+        if chain is not None:
+            return chain
+        return await asyncio.to_thread(self.get_enhanced_chain)
+
     async def warmup(self) -> bool:
         """Warm up the RAG service by initializing the chain in the background.
         
@@ -311,12 +472,29 @@ class RAGService:
     ) -> Dict[str, Any]:
         """Generate an answer for a question, using enhanced chain when possible."""
         history = chat_history or []
-        chain = self.get_enhanced_chain()
-        if chain:
-            result = self._run_enhanced_chain(chain, question, history)
-        else:
-            logger.warning("Enhanced RAG chain unavailable, falling back to legacy pipeline")
-            result = await self._run_fallback_pipeline(question)
+
+        # Semantically similar questions within the same conversation scope
+        # are answered straight from the cache instead of re-running
+        # retrieval and generation.
+        result = await asyncio.to_thread(
+            self._semantic_cache.get, question, conversation_id
+        )
+        if result is None:
+            chain = await self._aget_enhanced_chain()
+            if chain:
+                # chain.query is synchronous (embedding + LLM round-trip); run it
+                # in a worker thread so concurrent requests and WebSockets keep
+                # being serviced instead of serialising on the event loop.
+                result = await asyncio.to_thread(
+                    self._run_enhanced_chain, chain, question, history
+                )
+            else:
+                logger.warning("Enhanced RAG chain unavailable, falling back to legacy pipeline")
+                result = await self._run_fallback_pipeline(question)
+
+            await asyncio.to_thread(
+                self._semantic_cache.put, question, result, conversation_id
+            )
 
         if conversation_id is not None:
             try:
@@ -340,6 +518,81 @@ class RAGService:
 
         return result
 
+    async def generate_response_stream(
+        self,
+        *,
+        question: str,
+        chat_history: Optional[List[Dict[str, Any]]] = None,
+        conversation_id: Optional[int] = None,
+    ):
+        """Stream an answer as token frames followed by a complete frame.
+
+        Yields ``{"type": "token", "content": str}`` frames while the LLM
+        generates, then a final ``{"type": "complete", ...}`` frame carrying
+        the same payload :meth:`generate_response` returns. The fallback
+        pipeline has no native streaming, so it yields only the final frame.
+        """
+        history = chat_history or []
+
+        # The same semantic cache that fronts generate_response serves the
+        # streaming path: a hit skips retrieval and generation entirely and
+        # is replayed as one token frame so the client's streaming UI still
+        # renders it.
+        cached = await asyncio.to_thread(
+            self._semantic_cache.get, question, conversation_id
+        )
+        if cached is not None:
+            result = cached
+            if result.get("answer"):
+                yield {"type": "token", "content": result["answer"]}
+        else:
+            chain = await self._aget_enhanced_chain()
+
+            if chain is None:
+                logger.warning("Enhanced RAG chain unavailable, falling back to legacy pipeline")
+                result = await self._run_fallback_pipeline(question)
+            else:
+                raw_result: Optional[Dict[str, Any]] = None
+                async for frame in chain.astream_query(
+                    question=question,
+                    template_type=None,
+                    k=5,
+                    include_sources=True,
+                    chat_history=history,
+                ):
+                    if frame.get("type") == "token":
+                        yield frame
+                    else:
+                        raw_result = frame
+
+                if raw_result is None:
+                    raise RuntimeError("Streaming query produced no result frame")
+                # Citation formatting is a regex pass over the full answer;
+                # run it in the thread pool so other streaming connections
+                # keep flushing while it works.
+                result = await asyncio.to_thread(self._format_enhanced_result, raw_result)
+
+            await asyncio.to_thread(
+                self._semantic_cache.put, question, result, conversation_id
+            )
+
+        if conversation_id is not None:
+            try:
+                await self._persist_conversation_update(
+                    conversation_id,
+                    question=question,
+                    answer=result["answer"],
+                    sources=result.get("sources", []),
+                )
+            except ConversationError as exc:
+                logger.warning(
+                    "Failed to persist conversation update",
+                    conversation_id=conversation_id,
+                    error=str(exc),
+                )
+
+        yield {"type": "complete", **result}
+
     def _run_enhanced_chain(
         self,
         chain: EnhancedRAGChain,
@@ -353,7 +606,10 @@ class RAGService:
             include_sources=True,
             chat_history=chat_history,
         )
+        return self._format_enhanced_result(result)
 
+    def _format_enhanced_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize a raw enhanced-chain result into the response payload."""
         confidence = result.get("confidence_score")
         raw_sources = result.get("sources", [])
         formatted_sources = [
@@ -361,7 +617,12 @@ class RAGService:
             for idx, source in enumerate(raw_sources)
         ]
 
-        answer = apply_superscript_citations(result.get("answer", ""), formatted_sources)
+        # Sources are returned structured alongside the answer, and
+        # clean_answer_text strips any trailing Sources block anyway —
+        # skip building one just to throw it away.
+        answer = apply_superscript_citations(
+            result.get("answer", ""), formatted_sources, append_sources_block=False
+        )
         answer = clean_answer_text(answer)
 
         return {
@@ -374,56 +635,131 @@ class RAGService:
             "mode": "enhanced",
         }
 
-    async def _run_fallback_pipeline(self, question: str) -> Dict[str, Any]:
+    def _ensure_fallback_retriever(self) -> Any:
+        """Build the fallback retriever once and reuse it across requests.
+
+        The vector store and retriever are cheap to query but expensive to
+        construct; rebuilding them per request duplicated work the LLM
+        registry already avoids for the model client. The cached retriever
+        is dropped by :meth:`reset_chain` when new documents are ingested.
+        """
+        retriever = self._fallback_retriever
+        if retriever is not None:
+            return retriever
+
+        with self._fallback_lock:
+            if self._fallback_retriever is not None:
+                return self._fallback_retriever
+
+            vectordb = load_vector_store()
+            if not vectordb:
+                raise RuntimeError("Vector store not found. Please upload and ingest a document first.")
+
+            retriever = get_retriever(vectordb)
+            if not retriever:
+                raise RuntimeError("Retriever could not be created.")
+
+            self._fallback_retriever = retriever
+            return retriever
+
+    def _ensure_fallback_prompt(self) -> PromptTemplate:
+        """Load and compile the fallback prompt template exactly once.
+
+        The YAML prompt file is static configuration, so parsing it and
+        building the PromptTemplate on every request was pure overhead.
+        """
+        prompt = self._fallback_prompt
+        if prompt is not None:
+            return prompt
+
+        with self._fallback_lock:
+            if self._fallback_prompt is None:
+                prompt_path = os.path.join(PROMPTS_DIR, "rag_prompts.yaml")
+                with open(prompt_path, "r", encoding="utf-8") as handle:
+                    # libyaml's C loader parses ~10x faster than the pure-
+                    # Python SafeLoader; fall back when it isn't compiled in.
+                    prompt_config = yaml.load(
+                        handle, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                    )
+
+                self._fallback_prompt = PromptTemplate(
+                    template=prompt_config["template"],
+                    input_variables=["context", "question"],
+                )
+            return self._fallback_prompt
+
+    def _ensure_fallback_chain(self) -> Any:
+        """Compose the fallback chain once and reuse it across requests.
+
+        The chain only maps prompt inputs to an answer; retrieval happens
+        explicitly in :meth:`_run_fallback_pipeline` so the documents are
+        available for source formatting without any side-channel.
+        """
+        chain = self._fallback_chain
+        if chain is not None:
+            return chain
+
+        prompt = self._ensure_fallback_prompt()
         llm = get_llm()
-        vectordb = load_vector_store()
-        if not vectordb:
-            raise RuntimeError("Vector store not found. Please upload and ingest a document first.")
-
-        retriever = get_retriever(vectordb)
-        if not retriever:
-            raise RuntimeError("Retriever could not be created.")
-
-        prompt_path = os.path.join(PROMPTS_DIR, "rag_prompts.yaml")
-        with open(prompt_path, "r", encoding="utf-8") as handle:
-            prompt_config = yaml.safe_load(handle)
-
-        template = prompt_config["template"]
-        prompt = PromptTemplate(template=template, input_variables=["context", "question"])
-
-        async def get_context(x: Dict[str, Any]) -> str:
-            docs = await retriever.ainvoke(x["question"])
-            context = "\n\n".join(
-                f"[Source: {getattr(doc, 'metadata', {}).get('source', 'unknown')}] {doc.page_content}"
-                for doc in docs
-            )
-            x["_retrieved_docs"] = docs
-            return context
-
-        rag_chain = (
-            {"context": get_context, "question": lambda x: x["question"]}
-            | prompt
-            | llm
-            | StrOutputParser()
-        )
+        rag_chain = prompt | llm | StrOutputParser()
+
+        with self._fallback_lock:
+            if self._fallback_chain is None:
+                self._fallback_chain = rag_chain
+            return self._fallback_chain
+
+    async def _retrieve_documents(self, question: str) -> List[Any]:
+        """Retrieve documents for a question through a bounded LRU cache.
+
+        Repeated or re-asked questions skip the embedding and vector-store
+        search entirely. Entries are keyed on the normalised question and the
+        whole cache is invalidated by :meth:`reset_chain` after each ingest,
+        so stale corpora can never leak into answers.
+        """
+        cache_key = question.strip().lower()
+
+        async with self._retrieval_cache_lock:
+            cached = self._retrieval_cache.get(cache_key)
+            if cached is not None:
+                self._retrieval_cache.move_to_end(cache_key)
+                return cached
 
-        input_obj: Dict[str, Any] = {"question": question}
-        answer = await rag_chain.ainvoke(input_obj)
+        retriever = self._ensure_fallback_retriever()
+        docs = await retriever.ainvoke(question)
 
-        docs = input_obj.get("_retrieved_docs", [])
+        async with self._retrieval_cache_lock:
+            self._retrieval_cache[cache_key] = docs
+            self._retrieval_cache.move_to_end(cache_key)
+            if len(self._retrieval_cache) > self._MAX_RETRIEVAL_CACHE:
+                self._retrieval_cache.popitem(last=False)
+
+        return docs
+
+    async def _run_fallback_pipeline(self, question: str) -> Dict[str, Any]:
+        rag_chain = self._ensure_fallback_chain()
+
+        # Retrieve once; the same documents feed both the prompt context and
+        # the source payloads, instead of being smuggled out of the chain via
+        # a mutated input dict.
+        docs = await self._retrieve_documents(question)
+        # Retrieved docs are LangChain Documents, which always carry
+        # page_content/metadata — read the attributes directly instead of
+        # paying getattr-with-default on every doc.
+        context = "\n\n".join(
+            f"[Source: {doc.metadata.get('source', 'unknown')}] {doc.page_content}"
+            for doc in docs
+        )
+
+        answer = await rag_chain.ainvoke({"context": context, "question": question})
         formatted_sources = [
             normalize_source_payload(
-                {
-                    "id": idx + 1,
-                    "content": getattr(doc, "page_content", ""),
-                    "metadata": getattr(doc, "metadata", {}),
-                },
-                idx + 1,
+                {"id": idx, "content": doc.page_content, "metadata": doc.metadata},
+                idx,
             )
-            for idx, doc in enumerate(docs)
+            for idx, doc in enumerate(docs, 1)
         ]
 
-        answer = apply_superscript_citations(answer, formatted_sources)
+        answer = apply_superscript_citations(answer, formatted_sources, append_sources_block=False)
         answer = clean_answer_text(answer)
 
         return {
@@ -474,10 +810,14 @@ class RAGApplicationService:
         self._ingestion_service.schedule_job(
             job_id,
             file_path,
-            on_success=lambda _: self._rag_service.reset_chain(),
+            on_success=self._refresh_after_ingest,
         )
         return job_id, file_path
 
+    async def _refresh_after_ingest(self, _result: Dict[str, Any]) -> None:
+        """Rebuild the chain in the ingest worker so queries never stall."""
+        await asyncio.to_thread(self._rag_service.rebuild_chain)
+
     async def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         async with get_session() as session:
             repo = JobRepository(session)
@@ -496,6 +836,20 @@ class RAGApplicationService:
             conversation_id=conversation_id,
         )
 
+    def stream_query(
+        self,
+        *,
+        question: str,
+        chat_history: Optional[List[Dict[str, Any]]] = None,
+        conversation_id: Optional[int] = None,
+    ):
+        """Async iterator of token frames ending with a complete frame."""
+        return self._rag_service.generate_response_stream(
+            question=question,
+            chat_history=chat_history,
+            conversation_id=conversation_id,
+        )
+
     async def create_conversation(self, title: str, user_id: str = "default_user") -> Dict[str, Any]:
         return await self._rag_service.create_conversation(title, user_id)
 
@@ -23,6 +23,7 @@ Usage:
 
 import os
 import sqlite3
+import io
 import json
 import csv
 from typing import List, Dict, Any, Optional, Union
@@ -78,10 +79,19 @@ class DatabaseInspector:
             raise PermissionError(f"No read permission for database file: {self.db_path}")
     
     def connect(self) -> None:
-        """Establish a connection to the database."""
+        """Establish a read-only connection tuned for inspection workloads."""
         try:
-            self.conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            self.conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
             self.conn.row_factory = sqlite3.Row  # Enable column access by name
+            # Read-only pragmas: memory-map the file and enlarge the page
+            # cache so repeated table scans avoid filesystem round-trips.
+            self.conn.execute("PRAGMA query_only = ON;")
+            self.conn.execute("PRAGMA mmap_size = 268435456;")
+            self.conn.execute("PRAGMA cache_size = -8192;")
         except sqlite3.Error as e:
             raise sqlite3.Error(f"Failed to connect to database: {e}")
     
@@ -125,25 +135,26 @@ class DatabaseInspector:
         except sqlite3.Error as e:
             raise sqlite3.Error(f"Failed to fetch table names: {e}")
     
-    def get_table_info(self, table_name: str) -> TableInfo:
+    def get_table_info(self, table_name: str, limit: int = 10) -> TableInfo:
         """Get information about a specific table.
-        
+
         Args:
             table_name: Name of the table to inspect.
-            
+            limit: Maximum number of sample rows to fetch.
+
         Returns:
             TableInfo object containing schema and data.
-            
+
         Raises:
             sqlite3.Error: If there's an error executing the query.
             ValueError: If the table doesn't exist.
         """
         if not self.conn:
             self.connect()
-        
+
         # First verify the table exists and get its schema
         cursor = self.conn.cursor()
-        
+
         try:
             # Get table schema
             cursor.execute(f"PRAGMA table_info({self._sanitize_identifier(table_name)});")
@@ -151,18 +162,22 @@ class DatabaseInspector:
                 {"name": row[1], "type": row[2], "notnull": bool(row[3])}
                 for row in cursor.fetchall()
             ]
-            
+
             if not schema:
                 raise ValueError(f"Table '{table_name}' not found or has no columns")
-            
+
             # Get row count
             cursor.execute(f"SELECT COUNT(*) FROM {self._sanitize_identifier(table_name)};")
             row_count = cursor.fetchone()[0]
-            
-            # Get sample data
-            cursor.execute(f"SELECT * FROM {self._sanitize_identifier(table_name)} LIMIT 10;")
-            data = cursor.fetchall()
-            
+
+            # Get sample data in a single bounded fetch instead of pulling
+            # unlimited rows and slicing later
+            cursor.execute(
+                f"SELECT * FROM {self._sanitize_identifier(table_name)} LIMIT ?;",
+                (limit,),
+            )
+            data = cursor.fetchmany(limit)
+
             return TableInfo(
                 name=table_name,
                 schema=schema,
@@ -224,7 +239,7 @@ class DatabaseInspector:
             results = {}
             for table_name in tables:
                 try:
-                    table_info = self.get_table_info(table_name)
+                    table_info = self.get_table_info(table_name, limit=limit)
                     results[table_name] = table_info
                 except Exception as e:
                     print(f"{Fore.RED}Error processing table '{table_name}': {e}{Style.RESET_ALL}")
@@ -274,26 +289,28 @@ class DatabaseInspector:
             if output_format == OutputFormat.JSON:
                 return json.dumps(output_data, indent=2, default=str)
             else:  # CSV
-                # For CSV, we'll create a single table with all data
-                all_rows = []
-                for table_name, table_data in output_data.items():
-                    if "data" in table_data:
-                        for row in table_data["data"]:
-                            row_with_table = {"table": table_name, **row}
-                            all_rows.append(row_with_table)
-                
-                if not all_rows:
+                # For CSV, stream all tables into a single buffer row by row
+                rows = (
+                    {"table": table_name, **row}
+                    for table_name, table_data in output_data.items()
+                    for row in table_data.get("data", [])
+                )
+
+                first_row = next(rows, None)
+                if first_row is None:
                     return "No data to export to CSV"
-                
-                output = []
+
+                buffer = io.StringIO()
                 writer = csv.DictWriter(
-                    output,
-                    fieldnames=all_rows[0].keys(),
-                    quoting=csv.QUOTE_NONNUMERIC
+                    buffer,
+                    fieldnames=first_row.keys(),
+                    quoting=csv.QUOTE_NONNUMERIC,
+                    extrasaction="ignore",
                 )
                 writer.writeheader()
-                writer.writerows(all_rows)
-                return output.getvalue()
+                writer.writerow(first_row)
+                writer.writerows(rows)
+                return buffer.getvalue()
         
         else:  # Text-based output (grid or plain)
             output = []
@@ -351,12 +368,17 @@ class DatabaseInspector:
             print(f"{Fore.RED}Error writing to file {output_file}: {e}{Style.RESET_ALL}")
 
 
+DEFAULT_DB_PATH = Path(__file__).resolve().parents[2] / "conversations.db"
+
+
 def main() -> None:
     """Command-line interface for the database inspector."""
     import argparse
-    
+
     parser = argparse.ArgumentParser(description='Inspect SQLite database schema and data.')
-    parser.add_argument('db_path', help='Path to the SQLite database file')
+    parser.add_argument('db_path', nargs='?', default=str(DEFAULT_DB_PATH),
+                      help='Path to the SQLite database file '
+                           f'(default: {DEFAULT_DB_PATH})')
     parser.add_argument('--table', '-t', default='%',
                       help='Filter tables by name (SQL LIKE pattern)')
     parser.add_argument('--limit', '-l', type=int, default=10,
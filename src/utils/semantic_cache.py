@@ -0,0 +1,132 @@
+"""Bounded semantic cache for RAG query responses.
+
+RAG workloads show strong temporal-semantic locality: users re-ask the same
+or near-identical questions within a session. This module provides a small
+in-process LRU that returns a previously generated response when a new
+question is either an exact match or semantically close (cosine similarity
+above a threshold) to a cached one.
+
+The cache degrades gracefully: if no embedding function is available (or it
+fails), lookups fall back to exact-match behaviour only.
+"""
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def _cosine_similarity(left: List[float], right: List[float]) -> float:
+    """Cosine similarity between two vectors; 0.0 when either is degenerate."""
+    if len(left) != len(right):
+        return 0.0
+    dot = sum(a * b for a, b in zip(left, right))
+    left_norm = math.sqrt(sum(a * a for a in left))
+    right_norm = math.sqrt(sum(b * b for b in right))
+    if not left_norm or not right_norm:
+        return 0.0
+    return dot / (left_norm * right_norm)
+
+
+class SemanticQueryCache:
+    """LRU cache of query responses keyed by question meaning, not spelling.
+
+    Entries are scoped by conversation id so answers generated with one
+    conversation's history never leak into another. Lookups first try an
+    exact normalized-question hit, then scan same-scope entries for an
+    embedding whose cosine similarity clears the threshold.
+
+    Attributes:
+        _entries: OrderedDict mapping cache key to (scope, embedding, result).
+        _lock: Thread lock guarding the entry map.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Optional[Callable[[str], List[float]]] = None,
+        *,
+        max_entries: int = 256,
+        similarity_threshold: float = 0.92,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            embed_fn: Callable mapping a question to its embedding vector.
+                When None (or when it raises), only exact matches hit.
+            max_entries: Maximum number of cached responses before LRU
+                eviction kicks in.
+            similarity_threshold: Minimum cosine similarity for a semantic
+                hit; exact-match hits ignore this.
+        """
+        self._embed_fn = embed_fn
+        self._max_entries = max_entries
+        self._similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[List[float]], Dict[str, Any]]]" = OrderedDict()
+        self._lock = Lock()
+
+    @staticmethod
+    def _key(question: str, scope: Any) -> str:
+        return f"{scope}:{question.strip().lower()}"
+
+    def _embed(self, question: str) -> Optional[List[float]]:
+        if self._embed_fn is None:
+            return None
+        try:
+            return list(self._embed_fn(question))
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning("Semantic cache embedding failed", error=str(exc))
+            return None
+
+    def get(self, question: str, scope: Any = None) -> Optional[Dict[str, Any]]:
+        """Return a cached result for the question, or None on a miss."""
+        key = self._key(question, scope)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[2]
+
+        embedding = self._embed(question)
+        if embedding is None:
+            return None
+
+        with self._lock:
+            best_key = None
+            best_similarity = 0.0
+            for entry_key, (entry_scope, entry_embedding, _) in self._entries.items():
+                if entry_scope != scope or entry_embedding is None:
+                    continue
+                similarity = _cosine_similarity(embedding, entry_embedding)
+                if similarity > best_similarity:
+                    best_similarity = similarity
+                    best_key = entry_key
+
+            if best_key is not None and best_similarity >= self._similarity_threshold:
+                self._entries.move_to_end(best_key)
+                logger.debug(
+                    "Semantic cache hit",
+                    similarity=round(best_similarity, 4),
+                )
+                return self._entries[best_key][2]
+
+        return None
+
+    def put(self, question: str, result: Dict[str, Any], scope: Any = None) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+        key = self._key(question, scope)
+        embedding = self._embed(question)
+        with self._lock:
+            self._entries[key] = (scope, embedding, result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry (e.g. after new documents are ingested)."""
+        with self._lock:
+            self._entries.clear()
@@ -14,7 +14,8 @@ from __future__ import annotations
 
 import os
 import re
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
 from src.config import BASE_DIR
@@ -32,6 +33,16 @@ SUPERSCRIPT_MAP = {
     "9": "\u2079",
 }
 
+# Precomputed table so translation runs in C instead of per-character
+# Python dict lookups.
+_SUPERSCRIPT_TABLE = str.maketrans(SUPERSCRIPT_MAP)
+
+# Compiled once at import; these run over the full answer on every query.
+_BRACKET_CITATION_RE = re.compile(r"\[(\d+)\]")
+_CARET_CITATION_RE = re.compile(r"\^\{?(\d+)\}?")
+_SOURCES_BLOCK_RE = re.compile(r"\n+Sources?:.*$", re.IGNORECASE | re.DOTALL)
+_EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+
 
 def format_superscript(number: int) -> str:
     """Convert an integer into its superscript representation.
@@ -46,7 +57,29 @@ def format_superscript(number: int) -> str:
         >>> format_superscript(123)
         '¹²³'
     """
-    return "".join(SUPERSCRIPT_MAP.get(ch, ch) for ch in str(number))
+    return str(number).translate(_SUPERSCRIPT_TABLE)
+
+
+@lru_cache(maxsize=4096)
+def _path_fields(raw_path: str, base_dir: str) -> Tuple[str, str, str]:
+    """Derive (abspath, display path, basename) for a raw source path.
+
+    Chunks retrieved for one query usually share a handful of files, so the
+    os.path work is memoized per (path, base_dir) instead of repeated for
+    every source payload.
+    """
+    absolute = os.path.abspath(raw_path)
+    try:
+        display_path = os.path.relpath(absolute, base_dir)
+    except Exception:
+        display_path = absolute
+    return absolute, display_path, os.path.basename(absolute)
+
+
+@lru_cache(maxsize=4096)
+def _preview_url(basename: str) -> str:
+    """Memoized URL-quoting for preview links; basenames recur per corpus."""
+    return f"/files/preview/{quote(basename)}"
 
 
 def normalize_source_payload(
@@ -89,19 +122,17 @@ def normalize_source_payload(
         or metadata.get("raw_file_path")
         or metadata.get("source")
     )
+    basename = None
     if raw_path:
-        raw_path = os.path.abspath(raw_path)
+        raw_path, derived_display_path, basename = _path_fields(raw_path, base_dir)
 
     source_display_path = source.get("source_display_path") or metadata.get("source_display_path")
     if not source_display_path and raw_path:
-        try:
-            source_display_path = os.path.relpath(raw_path, base_dir)
-        except Exception:
-            source_display_path = raw_path
+        source_display_path = derived_display_path
 
     display_name = source.get("source_display_name") or metadata.get("source_display_name")
     if not display_name and raw_path:
-        display_name = os.path.basename(raw_path)
+        display_name = basename
     if not display_name:
         display_name = f"Document {index}"
 
@@ -115,8 +146,11 @@ def normalize_source_payload(
     if snippet:
         snippet = snippet.strip()
         if len(snippet) > 320:
-            truncated = snippet[:320].rsplit(" ", 1)[0]
-            snippet = f"{truncated}\u2026" if truncated else snippet[:320] + "\u2026"
+            # rfind avoids the throwaway list rsplit would allocate for
+            # every truncated source.
+            cut = snippet[:320]
+            space = cut.rfind(" ")
+            snippet = f"{cut[:space] if space > 0 else cut}\u2026"
 
     citation = source.get("citation") or format_superscript(source.get("id", index))
 
@@ -128,10 +162,8 @@ def normalize_source_payload(
             page_number = metadata.get("page") + 1
 
     preview_url = source.get("preview_url") or metadata.get("preview_url")
-    if not preview_url and raw_path:
-        filename = os.path.basename(raw_path)
-        if filename:
-            preview_url = f"/files/preview/{quote(filename)}"
+    if not preview_url and basename:
+        preview_url = _preview_url(basename)
 
     page_label = source.get("page_label") or metadata.get("page_label")
     if not page_label and page_number is not None:
@@ -203,8 +235,8 @@ def replace_bracket_citations(text: str) -> str:
     def _replace(match):
         return format_superscript(match.group(1))
 
-    updated = re.sub(r"\[(\d+)\]", _replace, text)
-    updated = re.sub(r"\^\{?(\d+)\}?", _replace, updated)
+    updated = _BRACKET_CITATION_RE.sub(_replace, text)
+    updated = _CARET_CITATION_RE.sub(_replace, updated)
     return updated
 
 
@@ -232,39 +264,34 @@ def apply_superscript_citations(
     formatted_answer = replace_bracket_citations(answer).strip()
 
     if append_sources_block and sources:
-        entries = []
-        for source in sources:
-            display_name = (
-                source.get("source_display_name")
-                or source.get("display_name")
-                or source.get("name")
-                or source.get("source_file")
-                or "Source"
-            )
-
-            page_label = source.get("page_label")
-            if not page_label:
-                page_number = source.get("page") or source.get("page_number")
-                if isinstance(page_number, int):
-                    page_label = f"Page {page_number}"
-
-            entry = f"- {display_name}"
-            if page_label:
-                entry += f" — {page_label}"
-
-            metadata = source.get("metadata") if isinstance(source.get("metadata"), dict) else {}
-            section = metadata.get("section")
-            if section:
-                entry += f" (Section: {section})"
-
-            entries.append(entry)
-
+        # Sources come from normalize_source_payload, so display_name,
+        # page_label, and metadata are already canonical — no need to
+        # re-derive them through chains of fallbacks here.
+        entries = "\n".join(
+            _format_source_entry(source) for source in sources
+        )
         if entries:
-            formatted_answer = f"{formatted_answer}\n\nSources:\n" + "\n".join(entries)
+            formatted_answer = f"{formatted_answer}\n\nSources:\n{entries}"
 
     return formatted_answer
 
 
+def _format_source_entry(source: Dict[str, Any]) -> str:
+    """Render one line of the Sources block from a normalized payload."""
+    entry = f"- {source.get('display_name') or 'Source'}"
+
+    page_label = source.get("page_label")
+    if page_label:
+        entry += f" — {page_label}"
+
+    metadata = source.get("metadata")
+    section = metadata.get("section") if isinstance(metadata, dict) else None
+    if section:
+        entry += f" (Section: {section})"
+
+    return entry
+
+
 def clean_answer_text(answer: str) -> str:
     """Normalize whitespace and remove trailing Sources blocks.
     
@@ -281,8 +308,8 @@ def clean_answer_text(answer: str) -> str:
         return ""
 
     cleaned = answer.strip()
-    cleaned = re.sub(r"\n+Sources?:.*$", "", cleaned, flags=re.IGNORECASE | re.DOTALL)
-    cleaned = re.sub(r"\n{3,}", "\n\n", cleaned).strip()
+    cleaned = _SOURCES_BLOCK_RE.sub("", cleaned)
+    cleaned = _EXCESS_NEWLINES_RE.sub("\n\n", cleaned).strip()
     return cleaned
 
 
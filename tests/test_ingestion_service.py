@@ -174,7 +174,7 @@ async def test_process_job_success(monkeypatch, tmp_path, repo_stubs):
     file_path.parent.mkdir(parents=True, exist_ok=True)
     file_path.write_text("content")
 
-    monkeypatch.setattr(ingestion_module, "process_document", lambda path: ["chunk1", "chunk2"])
+    monkeypatch.setattr(ingestion_module, "process_document", lambda path, checksum=None: ["chunk1", "chunk2"])
 
     captured = {}
 
@@ -223,7 +223,7 @@ async def test_process_job_skipped(monkeypatch, tmp_path, repo_stubs):
     file_path.parent.mkdir(parents=True, exist_ok=True)
     file_path.write_text("content")
 
-    monkeypatch.setattr(ingestion_module, "process_document", lambda path: [])
+    monkeypatch.setattr(ingestion_module, "process_document", lambda path, checksum=None: [])
 
     service = IngestionService()
     job_id = "job-skip"
@@ -257,7 +257,7 @@ async def test_process_job_failure(monkeypatch, tmp_path, repo_stubs):
     file_path.parent.mkdir(parents=True, exist_ok=True)
     file_path.write_text("content")
 
-    def raise_error(path):
+    def raise_error(path, checksum=None):
         raise ValueError("boom")
 
     monkeypatch.setattr(ingestion_module, "process_document", raise_error)
@@ -297,7 +297,7 @@ async def test_schedule_job_processes_and_invokes_callback(monkeypatch, tmp_path
     file_path.write_text("content")
 
     chunks = ["chunk1"]
-    monkeypatch.setattr(ingestion_module, "process_document", lambda path: chunks)
+    monkeypatch.setattr(ingestion_module, "process_document", lambda path, checksum=None: chunks)
     monkeypatch.setattr(ingestion_module, "build_vector_store", lambda processed: "vectordb")
 
     service = IngestionService()
@@ -143,3 +143,60 @@ async def test_generate_response_swallows_conversation_error(monkeypatch):
 
     assert result["mode"] == "enhanced"
     assert committed["called"] is False
+
+
+class DummyStreamingChain(DummyChain):
+    async def astream_query(self, **kwargs):
+        yield {"type": "token", "content": "Result"}
+        yield {"type": "token", "content": " [1]"}
+        yield {"type": "result", **self.query()}
+
+
+@pytest.mark.asyncio
+async def test_generate_response_stream_yields_tokens_then_complete(monkeypatch):
+    service = RAGService()
+    monkeypatch.setattr(service, "get_enhanced_chain", lambda: DummyStreamingChain())
+
+    frames = [frame async for frame in service.generate_response_stream(question="What?")]
+
+    assert [frame["type"] for frame in frames] == ["token", "token", "complete"]
+    assert frames[0]["content"] == "Result"
+    complete = frames[-1]
+    assert complete["mode"] == "enhanced"
+    assert "¹" in complete["answer"]
+    assert complete["sources"]
+
+
+@pytest.mark.asyncio
+async def test_generate_response_stream_falls_back_without_chain(monkeypatch):
+    service = RAGService()
+    monkeypatch.setattr(service, "get_enhanced_chain", lambda: None)
+
+    async def fake_fallback(question):  # pylint: disable=unused-argument
+        return {"answer": "fallback answer", "sources": [], "mode": "fallback"}
+
+    monkeypatch.setattr(service, "_run_fallback_pipeline", fake_fallback)
+
+    frames = [frame async for frame in service.generate_response_stream(question="Question?")]
+
+    assert len(frames) == 1
+    assert frames[0]["type"] == "complete"
+    assert frames[0]["mode"] == "fallback"
+
+
+@pytest.mark.asyncio
+async def test_generate_response_stream_serves_semantic_cache_hits(monkeypatch):
+    service = RAGService()
+    cached = {"answer": "cached answer", "sources": [], "mode": "enhanced"}
+    service._semantic_cache.put("What?", cached, None)
+
+    def fail_chain():
+        raise AssertionError("cache hit must not touch the chain")
+
+    monkeypatch.setattr(service, "get_enhanced_chain", fail_chain)
+
+    frames = [frame async for frame in service.generate_response_stream(question="What?")]
+
+    assert [frame["type"] for frame in frames] == ["token", "complete"]
+    assert frames[0]["content"] == "cached answer"
+    assert frames[1]["answer"] == "cached answer"
@@ -0,0 +1,57 @@
+import pytest
+
+from src.utils.semantic_cache import SemanticQueryCache
+
+
+def test_exact_match_hit_without_embeddings():
+    cache = SemanticQueryCache(embed_fn=None)
+    cache.put("What is RAG?", {"answer": "retrieval augmented generation"})
+
+    assert cache.get("  what is rag? ") == {"answer": "retrieval augmented generation"}
+    assert cache.get("What is BM25?") is None
+
+
+def test_semantic_hit_above_threshold():
+    embeddings = {
+        "what is rag?": [1.0, 0.0],
+        "explain rag": [0.99, 0.05],
+        "what is bm25?": [0.0, 1.0],
+    }
+    cache = SemanticQueryCache(
+        embed_fn=lambda q: embeddings[q.strip().lower()],
+        similarity_threshold=0.9,
+    )
+    cache.put("What is RAG?", {"answer": "rag"})
+
+    assert cache.get("Explain RAG") == {"answer": "rag"}
+    assert cache.get("What is BM25?") is None
+
+
+def test_scope_isolates_conversations():
+    cache = SemanticQueryCache(embed_fn=lambda q: [1.0])
+    cache.put("question", {"answer": "a"}, scope=1)
+
+    assert cache.get("question", scope=1) == {"answer": "a"}
+    assert cache.get("question", scope=2) is None
+
+
+def test_lru_eviction_respects_max_entries():
+    cache = SemanticQueryCache(embed_fn=None, max_entries=2)
+    cache.put("one", {"answer": 1})
+    cache.put("two", {"answer": 2})
+    cache.put("three", {"answer": 3})
+
+    assert cache.get("one") is None
+    assert cache.get("two") == {"answer": 2}
+    assert cache.get("three") == {"answer": 3}
+
+
+def test_embedding_failure_degrades_to_exact_match():
+    def broken(_question):
+        raise RuntimeError("no embedding backend")
+
+    cache = SemanticQueryCache(embed_fn=broken)
+    cache.put("question", {"answer": "a"})
+
+    assert cache.get("question") == {"answer": "a"}
+    assert cache.get("a different question") is None